@@ -5,6 +5,11 @@ from PyQt5.QtWidgets import (
     QPushButton, QWidget, QFileDialog, QMessageBox
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class TestPlanApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -58,8 +63,12 @@ class TestPlanApp(QMainWindow):
             return
 
         try:
-            with open(file_path, 'r') as file:
-                self.test_plan = json.load(file)
+            with open(file_path, 'rb') as file:
+                buf = file.read()
+            if orjson is not None:
+                self.test_plan = orjson.loads(buf)
+            else:
+                self.test_plan = json.loads(buf)
             
             for key, line_edit in self.fields.items():
                 value = self.test_plan.get(key, "")
@@ -82,8 +91,12 @@ class TestPlanApp(QMainWindow):
             for key, line_edit in self.fields.items():
                 self.test_plan[key] = line_edit.text()
 
-            with open(file_path, 'w') as file:
-                json.dump(self.test_plan, file, indent=4)
+            if orjson is not None:
+                buf = orjson.dumps(self.test_plan, option=orjson.OPT_INDENT_2)
+            else:
+                buf = json.dumps(self.test_plan, indent=2, ensure_ascii=False).encode("utf-8")
+            with open(file_path, 'wb') as file:
+                file.write(buf)
 
             QMessageBox.information(self, "Success", "Test plan saved successfully.")
         except Exception as e:
@@ -1,9 +1,24 @@
 import sys
+import os
 import json
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QSignalBlocker,
+    QAbstractTableModel,
+    QModelIndex,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QAction, QKeySequence, QPalette, QColor
 from PyQt6.QtWidgets import (
     QApplication,
@@ -21,65 +36,197 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QFileDialog,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QPushButton,
     QMenu,
     QStyleFactory,
 )
 
 import platform
-import ctypes
-from ctypes import wintypes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(buf: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_atomic(path: Path, buf: bytes):
+    """Write buf to path via a temp file + os.replace, so a failed write never truncates path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(buf)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+
+# Values shown in the Markdown preview, in signature order
+_MD_FIELDS = (
+    "test_name",
+    "test_no",
+    "purpose",
+    "scope",
+    "setup",
+    "procedure",
+    "measurement",
+    "acceptancecriteria",
+    "conclusion",
+)
+_MD_DEFAULTS = {"test_name": "Untitled Test", "test_no": "?"}
+_RH_FIELDS = ("rev", "rev_date", "description", "rev_by")
+
 
 def build_markdown_from_test(test: dict) -> str:
-    """Render a Markdown-ish view of a test dict."""
-    def g(key, default=""):
-        return test.get(key, default) or ""
-
-    lines = []
-    lines.append(f"# {g('test_name', 'Untitled Test')} (Test {g('test_no', '?')})")
-    lines.append("")
-    lines.append("## Purpose")
-    lines.append(g("purpose"))
-    lines.append("")
-    lines.append("## Scope")
-    lines.append(g("scope"))
-    lines.append("")
-    lines.append("## Setup")
-    lines.append(g("setup"))
-    lines.append("")
-    lines.append("## Procedure")
-    lines.append(g("procedure"))
-    lines.append("")
-    lines.append("## Measurement")
-    lines.append(g("measurement"))
-    lines.append("")
-    lines.append("## Acceptance Criteria")
-    lines.append(g("acceptancecriteria"))
-    lines.append("")
-    lines.append("## Conclusion")
-    lines.append(g("conclusion"))
-    lines.append("")
+    """Render a Markdown-ish view of a test dict.
+
+    The render is memoized on the displayed values, so a test whose visible
+    fields have not changed is a cache hit.
+    """
+    fields = tuple(str(test.get(k, _MD_DEFAULTS.get(k, "")) or "") for k in _MD_FIELDS)
+    rh = test.get("revision_history", []) or ()
+    rh_rows = tuple(tuple(str(e.get(k, "")) for k in _RH_FIELDS) for e in rh)
+    return _render_markdown(fields, rh_rows)
+
+
+@lru_cache(maxsize=16)
+def _render_markdown(fields: tuple, rh_rows: tuple) -> str:
+    name, no, purpose, scope, setup, procedure, measurement, criteria, conclusion = fields
 
     # Revision history (simple table)
-    rh = test.get("revision_history", [])
-    if rh:
-        lines.append("---")
-        lines.append("")
-        lines.append("## Revision History")
-        lines.append("")
-        lines.append("| Rev | Date | Description | By |")
-        lines.append("|-----|------|-------------|----|")
-        for entry in rh:
-            rev = entry.get("rev", "")
-            date = entry.get("rev_date", "")
-            desc = entry.get("description", "")
-            by = entry.get("rev_by", "")
-            lines.append(f"| {rev} | {date} | {desc} | {by} |")
-        lines.append("")
-
-    return "\n".join(lines)
+    rh_block = ""
+    if rh_rows:
+        rows = "\n".join(f"| {rev} | {date} | {desc} | {by} |" for rev, date, desc, by in rh_rows)
+        rh_block = f"""
+---
+
+## Revision History
+
+| Rev | Date | Description | By |
+|-----|------|-------------|----|
+{rows}
+"""
+
+    return f"""# {name} (Test {no})
+
+## Purpose
+{purpose}
+
+## Scope
+{scope}
+
+## Setup
+{setup}
+
+## Procedure
+{procedure}
+
+## Measurement
+{measurement}
+
+## Acceptance Criteria
+{criteria}
+
+## Conclusion
+{conclusion}
+{rh_block}"""
+
+
+_HEADER_KEYS = ("test_name", "test_no")
+
+
+def _probe_header(path: Path) -> dict:
+    """Read just test_name/test_no from a test JSON, stopping once both are seen.
+
+    Uses ijson to stream the top-level keys when it is installed, otherwise
+    falls back to parsing the whole file.
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = _json_loads(path.read_bytes())
+        if not isinstance(data, dict):
+            return {}
+        return {k: data[k] for k in _HEADER_KEYS if k in data}
+
+    header = {}
+    with path.open("rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in _HEADER_KEYS and event in ("string", "number", "boolean", "null"):
+                header[prefix] = value
+                if len(header) == len(_HEADER_KEYS):
+                    break
+    return header
+
+
+class FolderScanSignals(QObject):
+    finished = pyqtSignal(int, list)  # scan_id, [(path, header dict), ...]
+
+
+class FolderScanner(QRunnable):
+    """Parse the test JSON files of a folder on a worker thread."""
+
+    def __init__(self, folder: Path, scan_id: int):
+        super().__init__()
+        self.folder = folder
+        self.scan_id = scan_id
+        self.signals = FolderScanSignals()
+
+    def run(self):
+        # scandir entries carry the file type, so no extra stat per entry
+        try:
+            with os.scandir(self.folder) as it:
+                entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+        except OSError as e:
+            # Missing/unreadable folder: report it and finish with no tests
+            print(f"Cannot scan {self.folder}: {e}")
+            self.signals.finished.emit(self.scan_id, [])
+            return
+        entries.sort(key=lambda e: e.name)
+        paths = [Path(e.path) for e in entries]
+
+        # Overlap the per-file reads; map() still yields in sorted order
+        found = []
+        workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for path, header in ex.map(self._read_header, paths):
+                # Heuristic: treat as test if it has test_name and test_no
+                if header and "test_name" in header and "test_no" in header:
+                    found.append((str(path), header))
+        self.signals.finished.emit(self.scan_id, found)
+
+    @staticmethod
+    def _read_header(path: Path) -> tuple[Path, dict | None]:
+        try:
+            return path, _probe_header(path)
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+            return path, None
+
+
+# Filename slug patterns for TestEditorWindow._slugify_name
+_WS_RE = re.compile(r"\s+")
+_BAD_RE = re.compile(r"[^a-z0-9_]+")
+
+# Test file bytes kept by TestEditorWindow._read_test_json
+_JSON_CACHE_SIZE = 64
 
 
 # Column definitions for variable tables
@@ -90,6 +237,83 @@ TH_COLUMNS = ["parameter", "target_value", "lower_limit", "upper_limit", "units"
 EX_COLUMNS = ["type", "description", "data_value", "file_ref", "notes"]
 RH_COLUMNS = ["rev", "rev_date", "description", "rev_by"]
 
+# (test dict key, tab title, columns) for each editable table
+TABLE_SPECS = (
+    ("revision_history", "Revisions", RH_COLUMNS),
+    ("testpoints", "Testpoints", TP_COLUMNS),
+    ("measurement_equipment", "Equipment", EQ_COLUMNS),
+    ("measurement_settings", "Settings", MS_COLUMNS),
+    ("acceptance_thresholds", "Thresholds", TH_COLUMNS),
+    ("example_data", "Examples", EX_COLUMNS),
+)
+
+
+class ListOfDictsModel(QAbstractTableModel):
+    """Editable table model over a list of row dicts, one column per key.
+
+    The list is edited in place, so when it is the list stored in the test
+    dict, cell edits land in the test directly.
+    """
+
+    def __init__(self, columns: list[str], parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows: list[dict] = []
+
+    def set_rows(self, rows: list[dict]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def prune_empty_rows(self):
+        """Drop rows whose cells are all blank (e.g. added but never filled in)."""
+        cols = self._columns
+        kept = [r for r in self._rows if any(str(r.get(c, "")).strip() for c in cols)]
+        if len(kept) == len(self._rows):
+            return
+        self.beginResetModel()
+        self._rows[:] = kept
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return str(self._rows[index.row()].get(self._columns[index.column()], ""))
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        self._rows[index.row()][self._columns[index.column()]] = str(value).strip()
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return None
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        for _ in range(count):
+            self._rows.insert(row, {c: "" for c in self._columns})
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
 
 class TestEditorWindow(QMainWindow):
     def __init__(self):
@@ -100,7 +324,23 @@ class TestEditorWindow(QMainWindow):
         self.current_folder: Path | None = None
         self.current_path: Path | None = None  # None = new/unsaved test
         self.current_test: dict = {}
-        self._suppress_updates = False
+        self._md_text = ""  # last text pushed into markdown_view
+
+        # Background folder scan state
+        self._scan_id = 0
+        self._scanner: FolderScanner | None = None
+
+        # path -> numeric test_no of each listed test, for _suggest_next_test_no
+        self._test_nos: dict[str, int] = {}
+
+        # path -> (mtime_ns, parsed test), least recently used first
+        self._json_cache: OrderedDict[str, tuple[int, bytes]] = OrderedDict()
+
+        # Coalesce live Markdown preview rebuilds while typing
+        self._md_timer = QTimer(self)
+        self._md_timer.setSingleShot(True)
+        self._md_timer.setInterval(150)
+        self._md_timer.timeout.connect(self._rebuild_markdown)
 
         self._create_actions()
         self._create_menu()
@@ -165,20 +405,20 @@ class TestEditorWindow(QMainWindow):
         form_widget = QWidget()
         form_layout = QFormLayout(form_widget)
 
+        # The widgets hold the field values; they are copied into
+        # current_test only when previewing or saving.
         self.field_edits = {}
 
         def add_line_field(key: str, label: str):
             edit = QLineEdit()
             self.field_edits[key] = edit
-            edit.textChanged.connect(lambda text, k=key: self.on_field_changed(k, text))
+            edit.textChanged.connect(self._schedule_markdown)
             form_layout.addRow(label, edit)
 
         def add_text_field(key: str, label: str):
             edit = QTextEdit()
             self.field_edits[key] = edit
-            edit.textChanged.connect(
-                lambda k=key: self.on_field_changed(k, self.field_edits[k].toPlainText())
-            )
+            edit.textChanged.connect(self._schedule_markdown)
             form_layout.addRow(label, edit)
 
         add_line_field("test_name", "Test Name")
@@ -199,23 +439,27 @@ class TestEditorWindow(QMainWindow):
         self.markdown_view.setReadOnly(True)
         tabs.addTab(self.markdown_view, "Markdown Preview")
 
-    def _create_table_tab(
-        self,
-        parent_tabs: QTabWidget,
-        title: str,
-        columns: list[str],
-        cell_changed_handler,
-    ):
-        """Helper to create a tab with a table and add/remove buttons."""
+    def _create_table_tab(self, parent_tabs: QTabWidget, key: str, title: str, columns: list[str]):
+        """Add the model and an empty tab for a table; the view is built on first show."""
+        model = ListOfDictsModel(columns, self)
+        self.table_models[key] = model
+        # Any user edit marks the array as needing cleanup on save
+        model.dataChanged.connect(lambda *_, k=key: self._dirty_arrays.add(k))
+        model.rowsInserted.connect(lambda *_, k=key: self._dirty_arrays.add(k))
+        model.rowsRemoved.connect(lambda *_, k=key: self._dirty_arrays.add(k))
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-
-        table = QTableWidget()
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
+        QVBoxLayout(widget)
+        index = parent_tabs.addTab(widget, title)
+        self._unbuilt_table_tabs[index] = (key, widget)
+
+    def _build_table_view(self, key: str, widget: QWidget):
+        """Fill a table tab with its view and add/remove buttons."""
+        model = self.table_models[key]
+        table = QTableView()
+        table.setModel(model)
         table.horizontalHeader().setStretchLastSection(True)
         table.verticalHeader().setVisible(False)
-        table.setEditTriggers(QTableWidget.EditTrigger.AllEditTriggers)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
 
         # Buttons
         btn_row = QHBoxLayout()
@@ -225,112 +469,70 @@ class TestEditorWindow(QMainWindow):
         btn_row.addWidget(del_btn)
         btn_row.addStretch()
 
+        layout = widget.layout()
         layout.addWidget(table)
         layout.addLayout(btn_row)
 
-        parent_tabs.addTab(widget, title)
-
         # Connect signals
-        table.cellChanged.connect(cell_changed_handler)
-        add_btn.clicked.connect(
-            lambda: self._add_row_to_table(table, columns, cell_changed_handler)
-        )
-        del_btn.clicked.connect(
-            lambda: self._delete_row_from_table(table, columns, cell_changed_handler)
-        )
+        add_btn.clicked.connect(lambda: model.insertRows(model.rowCount(), 1))
+        del_btn.clicked.connect(lambda: self._delete_row_from_table(table, model))
 
-        return table
+        self.table_views[key] = table
 
-    def _create_right_panels(self, tabs: QTabWidget):
-        # Revision history
-        self.rh_table = self._create_table_tab(
-            tabs, "Revisions", RH_COLUMNS, self.on_rh_cell_changed
-        )
+    def _on_right_tab_changed(self, index: int):
+        pending = self._unbuilt_table_tabs.pop(index, None)
+        if pending is not None:
+            self._build_table_view(*pending)
 
-        # Variable tables
-        self.tp_table = self._create_table_tab(
-            tabs, "Testpoints", TP_COLUMNS, self.on_tp_cell_changed
-        )
-        self.eq_table = self._create_table_tab(
-            tabs, "Equipment", EQ_COLUMNS, self.on_eq_cell_changed
-        )
-        self.ms_table = self._create_table_tab(
-            tabs, "Settings", MS_COLUMNS, self.on_ms_cell_changed
-        )
-        self.th_table = self._create_table_tab(
-            tabs, "Thresholds", TH_COLUMNS, self.on_th_cell_changed
-        )
-        self.ex_table = self._create_table_tab(
-            tabs, "Examples", EX_COLUMNS, self.on_ex_cell_changed
-        )
+    def _create_right_panels(self, tabs: QTabWidget):
+        # Revision history + variable tables, keyed by test dict key.
+        # Models always exist (loading a test fills them); views are created lazily.
+        self.table_views: dict[str, QTableView] = {}
+        self.table_models: dict[str, ListOfDictsModel] = {}
+        self._unbuilt_table_tabs: dict[int, tuple[str, QWidget]] = {}
+        self._dirty_arrays: set[str] = set()
+        for key, title, columns in TABLE_SPECS:
+            self._create_table_tab(tabs, key, title, columns)
 
         # Keywords editor
         kw_widget = QWidget()
         kw_layout = QVBoxLayout(kw_widget)
         self.keywords_edit = QPlainTextEdit()
         self.keywords_edit.setPlaceholderText("One keyword per line…")
-        self.keywords_edit.textChanged.connect(self.on_keywords_changed)
         kw_layout.addWidget(self.keywords_edit)
         tabs.addTab(kw_widget, "Keywords")
 
+        tabs.currentChanged.connect(self._on_right_tab_changed)
+        self._on_right_tab_changed(tabs.currentIndex())
+
     # ----- Helpers for table row management -----
 
-    def _add_row_to_table(self, table: QTableWidget, columns: list[str], handler):
-        if self._suppress_updates:
-            return
-        self._suppress_updates = True
-        row = table.rowCount()
-        table.insertRow(row)
-        for col in range(len(columns)):
-            table.setItem(row, col, QTableWidgetItem(""))
-        self._suppress_updates = False
-        # Trigger a sync manually after adding a blank row
-        handler(row, 0)
-
-    def _delete_row_from_table(self, table: QTableWidget, columns: list[str], handler):
-        if self._suppress_updates:
-            return
-        row = table.currentRow()
+    def _delete_row_from_table(self, table: QTableView, model: ListOfDictsModel):
+        row = table.currentIndex().row()
         if row < 0:
             return
-        self._suppress_updates = True
-        table.removeRow(row)
-        self._suppress_updates = False
-        # After deletion we resync whole corresponding array from the table
-        if table is self.rh_table:
-            self._sync_rh_from_table()
-        elif table is self.tp_table:
-            self._sync_tp_from_table()
-        elif table is self.eq_table:
-            self._sync_eq_from_table()
-        elif table is self.ms_table:
-            self._sync_ms_from_table()
-        elif table is self.th_table:
-            self._sync_th_from_table()
-        elif table is self.ex_table:
-            self._sync_ex_from_table()
+        model.removeRows(row, 1)
 
     # ----- Helpers for naming / numbering -----
 
     def _suggest_next_test_no(self) -> str:
-        """Look at the list labels and suggest the next numeric test number."""
-        max_no = 0
-        for i in range(self.test_list.count()):
-            item = self.test_list.item(i)
-            label = item.text()
-            # Label format: "NNN – Name"
-            no_part = label.split("–", 1)[0].strip()
-            if no_part.isdigit():
-                max_no = max(max_no, int(no_part))
+        """Suggest the next numeric test number after those of the listed tests."""
+        max_no = max(self._test_nos.values(), default=0)
         if max_no <= 0:
             return "001"
         return f"{max_no + 1:03d}"
 
+    def _record_test_no(self, path_str: str, test_no):
+        """Track the numeric test_no of a listed test (non-numeric ones are ignored)."""
+        no_part = str(test_no).strip()
+        if no_part.isdigit():
+            self._test_nos[path_str] = int(no_part)
+        else:
+            self._test_nos.pop(path_str, None)
+
     def _slugify_name(self, text: str) -> str:
         """Create a filesystem-friendly name fragment from test_name."""
-        text = text.strip().lower()
-        text = re.sub(r"\s+", "_", text)
-        text = re.sub(r"[^a-z0-9_]+", "", text)
+        text = _BAD_RE.sub("", _WS_RE.sub("_", text.strip().lower()))
         return text or "new_test"
 
     def _add_or_update_list_item_for_current_test(self):
@@ -339,6 +541,7 @@ class TestEditorWindow(QMainWindow):
             return
         path_str = str(self.current_path)
         label = f"{self.current_test.get('test_no', '?')} – {self.current_test.get('test_name', 'Untitled')}"
+        self._record_test_no(path_str, self.current_test.get("test_no", ""))
         # Try to find an existing item with this path
         for i in range(self.test_list.count()):
             item = self.test_list.item(i)
@@ -352,57 +555,70 @@ class TestEditorWindow(QMainWindow):
         self.test_list.addItem(item)
         self.test_list.setCurrentItem(item)
 
+    def _blocked_field_signals(self) -> ExitStack:
+        """Block textChanged on the core fields and keywords editor until the stack exits."""
+        stack = ExitStack()
+        for widget in (*self.field_edits.values(), self.keywords_edit):
+            stack.enter_context(QSignalBlocker(widget))
+        return stack
+
     def _clear_current_test_view(self):
         """Clear all form fields, tables, and preview."""
-        self._suppress_updates = True
-        for widget in self.field_edits.values():
-            if isinstance(widget, QLineEdit):
-                widget.clear()
-            elif isinstance(widget, QTextEdit):
-                widget.clear()
-        self.keywords_edit.clear()
-        for table in (
-            self.rh_table,
-            self.tp_table,
-            self.eq_table,
-            self.ms_table,
-            self.th_table,
-            self.ex_table,
-        ):
-            table.setRowCount(0)
+        with self._blocked_field_signals():
+            for widget in self.field_edits.values():
+                if isinstance(widget, QLineEdit):
+                    widget.clear()
+                elif isinstance(widget, QTextEdit):
+                    widget.clear()
+            self.keywords_edit.clear()
+        for model in self.table_models.values():
+            model.set_rows([])
+        self._dirty_arrays.clear()
         self.markdown_view.clear()
-        self._suppress_updates = False
+        self._md_text = ""
 
     # ----- Folder / file handling -----
 
     def open_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Test Folder")
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Select Test Folder",
+            options=QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontUseCustomDirectoryIcons,
+        )
         if not folder:
             return
         self.current_folder = Path(folder)
         self.load_tests_from_folder(self.current_folder)
 
     def load_tests_from_folder(self, folder: Path):
+        """Rescan folder in the background; the list is filled when the scan finishes."""
         self.test_list.clear()
+        self._test_nos.clear()
         self.current_path = None
         self.current_test = {}
         self._clear_current_test_view()
-        self._suppress_updates = True
 
-        for path in sorted(folder.glob("*.json")):
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Heuristic: treat as test if it has test_name and test_no
-                if "test_name" in data and "test_no" in data:
-                    label = f"{data.get('test_no', '?')} – {data.get('test_name', 'Untitled')}"
-                    item = QListWidgetItem(label)
-                    item.setData(Qt.ItemDataRole.UserRole, str(path))
-                    self.test_list.addItem(item)
-            except Exception as e:
-                print(f"Skipping {path}: {e}")
+        # A newer scan makes results from any still-running one stale
+        self._scan_id += 1
+        scanner = FolderScanner(folder, self._scan_id)
+        scanner.signals.finished.connect(self._on_scan_finished)
+        self._scanner = scanner
+        QThreadPool.globalInstance().start(scanner)
+
+    def _on_scan_finished(self, scan_id: int, found: list):
+        if scan_id != self._scan_id:
+            return
+        self._scanner = None
 
-        self._suppress_updates = False
+        # Only the headers were read; load_test_file parses the full file on selection.
+        # One addItems() call inserts all rows in a single batch.
+        self.test_list.addItems(
+            [f"{h.get('test_no', '?')} – {h.get('test_name', 'Untitled')}" for _, h in found]
+        )
+        for i, (path_str, header) in enumerate(found):
+            self.test_list.item(i).setData(Qt.ItemDataRole.UserRole, path_str)
+            self._record_test_no(path_str, header.get("test_no", ""))
 
         if self.test_list.count() == 0:
             QMessageBox.information(self, "No Tests Found", "No test JSON files found in this folder.")
@@ -410,8 +626,6 @@ class TestEditorWindow(QMainWindow):
             self.test_list.setCurrentRow(0)
 
     def on_test_selection_changed(self):
-        if self._suppress_updates:
-            return
         items = self.test_list.selectedItems()
         if not items:
             return
@@ -422,37 +636,57 @@ class TestEditorWindow(QMainWindow):
         path = Path(path_str)
         self.load_test_file(path)
 
+    def _read_test_json(self, path: Path) -> dict:
+        """Parse a test JSON, reusing the cached file bytes while its mtime is unchanged.
+
+        Every call parses afresh, so the caller always gets a private dict to
+        mutate; re-parsing is cheaper than deep-copying a cached parse.
+        """
+        key = str(path)
+        mtime = path.stat().st_mtime_ns
+        hit = self._json_cache.get(key)
+        if hit is not None and hit[0] == mtime:
+            self._json_cache.move_to_end(key)
+            return _json_loads(hit[1])
+
+        with path.open("rb") as f:
+            buf = f.read()
+        data = _json_loads(buf)
+        self._json_cache[key] = (mtime, buf)
+        self._json_cache.move_to_end(key)
+        while len(self._json_cache) > _JSON_CACHE_SIZE:
+            self._json_cache.popitem(last=False)
+        return data
+
     def load_test_file(self, path: Path):
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_test_json(path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load {path}:\n{e}")
             return
 
         self.current_path = path
         self.current_test = data
-        self._suppress_updates = True
 
-        # Populate core fields
-        for key, widget in self.field_edits.items():
-            value = data.get(key, "") or ""
-            if isinstance(widget, QLineEdit):
-                widget.setText(value)
-            elif isinstance(widget, QTextEdit):
-                widget.setPlainText(value)
+        with self._blocked_field_signals():
+            # Populate core fields
+            for key, widget in self.field_edits.items():
+                value = data.get(key, "") or ""
+                if isinstance(widget, QLineEdit):
+                    widget.setText(value)
+                elif isinstance(widget, QTextEdit):
+                    widget.setPlainText(value)
 
-        # Keywords
-        keywords = data.get("keywords", [])
-        self.keywords_edit.setPlainText("\n".join(keywords))
+            # Keywords (tests often share the same list; skip the reset if unchanged)
+            kw_text = "\n".join(data.get("keywords", []))
+            if self.keywords_edit.toPlainText() != kw_text:
+                self.keywords_edit.setPlainText(kw_text)
 
         # Revision + variable tables
         self._populate_tables_from_test(data)
 
         # Markdown preview
-        self.markdown_view.setPlainText(build_markdown_from_test(data))
-
-        self._suppress_updates = False
+        self._set_markdown(build_markdown_from_test(data))
 
     # ----- Context menu on test list -----
 
@@ -492,6 +726,7 @@ class TestEditorWindow(QMainWindow):
         try:
             if path.exists():
                 path.unlink()
+            self._json_cache.pop(path_str, None)
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -503,6 +738,7 @@ class TestEditorWindow(QMainWindow):
         # Remove from list
         row = self.test_list.row(item)
         self.test_list.takeItem(row)
+        self._test_nos.pop(path_str, None)
 
         # If this was the current test, clear editor
         if self.current_path and path == self.current_path:
@@ -524,15 +760,12 @@ class TestEditorWindow(QMainWindow):
         src_path = Path(path_str)
 
         try:
-            with src_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Already a private copy, safe to modify
+            new_test = self._read_test_json(src_path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to read source test:\n{src_path}\n\n{e}")
             return
 
-        # Deep copy
-        new_test = json.loads(json.dumps(data))
-
         old_no = (new_test.get("test_no") or "").strip()
         new_no = self._suggest_next_test_no()
         new_test["last_test_no"] = old_no
@@ -564,19 +797,18 @@ class TestEditorWindow(QMainWindow):
 
         # Write new file
         try:
-            with dst_path.open("w", encoding="utf-8") as f:
-                json.dump(new_test, f, indent=2, ensure_ascii=False)
+            _write_atomic(dst_path, _json_dumps(new_test))
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to write duplicated test:\n{dst_path}\n\n{e}")
             return
 
-        # Reload folder and select the new item
-        self.load_tests_from_folder(self.current_folder)
-        for i in range(self.test_list.count()):
-            it = self.test_list.item(i)
-            if it and it.data(Qt.ItemDataRole.UserRole) == str(dst_path):
-                self.test_list.setCurrentItem(it)
-                break
+        # Add just the new file to the list and select it
+        label = f"{new_no} – {new_test.get('test_name', 'Untitled')}"
+        new_item = QListWidgetItem(label)
+        new_item.setData(Qt.ItemDataRole.UserRole, str(dst_path))
+        self.test_list.addItem(new_item)
+        self._record_test_no(str(dst_path), new_no)
+        self.test_list.setCurrentItem(new_item)
 
     # ----- New Test -----
 
@@ -620,24 +852,23 @@ class TestEditorWindow(QMainWindow):
 
         self.current_test = new_test
         self.current_path = None  # unsaved
-        self._suppress_updates = True
 
         # Clear selection to show we are editing a new, unsaved test
-        self.test_list.clearSelection()
+        with QSignalBlocker(self.test_list):
+            self.test_list.clearSelection()
 
         # Populate UI from template
-        for key, widget in self.field_edits.items():
-            value = new_test.get(key, "") or ""
-            if isinstance(widget, QLineEdit):
-                widget.setText(value)
-            elif isinstance(widget, QTextEdit):
-                widget.setPlainText(value)
-
-        self.keywords_edit.setPlainText("")
+        with self._blocked_field_signals():
+            for key, widget in self.field_edits.items():
+                value = new_test.get(key, "") or ""
+                if isinstance(widget, QLineEdit):
+                    widget.setText(value)
+                elif isinstance(widget, QTextEdit):
+                    widget.setPlainText(value)
+
+            self.keywords_edit.setPlainText("")
         self._populate_tables_from_test(new_test)
-        self.markdown_view.setPlainText(build_markdown_from_test(new_test))
-
-        self._suppress_updates = False
+        self._set_markdown(build_markdown_from_test(new_test))
 
     # ----- Save -----
 
@@ -654,13 +885,10 @@ class TestEditorWindow(QMainWindow):
             )
             return
 
-        # Sync arrays from tables into the dict
-        self._sync_rh_from_table()
-        self._sync_tp_from_table()
-        self._sync_eq_from_table()
-        self._sync_ms_from_table()
-        self._sync_th_from_table()
-        self._sync_ex_from_table()
+        # Sync fields from the widgets into the dict; the tables edit it in place
+        self._sync_fields_from_widgets()
+        for key in self._dirty_arrays:
+            self.table_models[key].prune_empty_rows()
 
         # If this is a new/unsaved test, choose a filename
         if self.current_path is None:
@@ -681,8 +909,10 @@ class TestEditorWindow(QMainWindow):
             self.current_path = path
 
         try:
-            with self.current_path.open("w", encoding="utf-8") as f:
-                json.dump(self.current_test, f, indent=2, ensure_ascii=False)
+            buf = _json_dumps(self.current_test)
+            self._json_cache.pop(str(self.current_path), None)
+            _write_atomic(self.current_path, buf)
+            self._dirty_arrays.clear()
             self._add_or_update_list_item_for_current_test()
             QMessageBox.information(self, "Saved", f"Saved {self.current_path.name}")
         except Exception as e:
@@ -690,136 +920,55 @@ class TestEditorWindow(QMainWindow):
 
     # ----- Data binding for core + keywords -----
 
-    def on_field_changed(self, key: str, value: str):
-        if self._suppress_updates or not self.current_test:
-            return
-        self.current_test[key] = value
-        self.markdown_view.setPlainText(build_markdown_from_test(self.current_test))
-
-    def on_keywords_changed(self):
-        if self._suppress_updates or not self.current_test:
-            return
-        text = self.keywords_edit.toPlainText()
-        keywords = [line.strip() for line in text.splitlines() if line.strip()]
-        self.current_test["keywords"] = keywords
-
-    # ----- Populate tables from test dict -----
-
-    def _populate_tables_from_test(self, test: dict):
-        def fill_table(table: QTableWidget, cols: list[str], rows: list[dict]):
-            table.blockSignals(True)
-            table.setRowCount(0)
-            for row_data in rows:
-                row = table.rowCount()
-                table.insertRow(row)
-                for c, key in enumerate(cols):
-                    value = row_data.get(key, "")
-                    table.setItem(row, c, QTableWidgetItem(str(value)))
-            table.blockSignals(False)
-
-        fill_table(self.rh_table, RH_COLUMNS, test.get("revision_history", []))
-        fill_table(self.tp_table, TP_COLUMNS, test.get("testpoints", []))
-        fill_table(self.eq_table, EQ_COLUMNS, test.get("measurement_equipment", []))
-        fill_table(self.ms_table, MS_COLUMNS, test.get("measurement_settings", []))
-        fill_table(self.th_table, TH_COLUMNS, test.get("acceptance_thresholds", []))
-        fill_table(self.ex_table, EX_COLUMNS, test.get("example_data", []))
-
-    # ----- Sync helpers: tables -> dict -----
-
-    def _sync_array_from_table(self, table: QTableWidget, cols: list[str]) -> list[dict]:
-        rows_data: list[dict] = []
-        for row in range(table.rowCount()):
-            row_dict: dict = {}
-            empty = True
-            for c, key in enumerate(cols):
-                item = table.item(row, c)
-                text = item.text().strip() if item is not None else ""
-                if text:
-                    empty = False
-                row_dict[key] = text
-            if not empty:
-                rows_data.append(row_dict)
-        return rows_data
-
-    def _sync_rh_from_table(self):
+    def _sync_fields_from_widgets(self):
+        """Copy the core field widgets and keywords editor into current_test."""
         if not self.current_test:
             return
-        self.current_test["revision_history"] = self._sync_array_from_table(
-            self.rh_table, RH_COLUMNS
-        )
-
-    def _sync_tp_from_table(self):
-        if not self.current_test:
-            return
-        self.current_test["testpoints"] = self._sync_array_from_table(
-            self.tp_table, TP_COLUMNS
-        )
-
-    def _sync_eq_from_table(self):
-        if not self.current_test:
-            return
-        self.current_test["measurement_equipment"] = self._sync_array_from_table(
-            self.eq_table, EQ_COLUMNS
-        )
-
-    def _sync_ms_from_table(self):
-        if not self.current_test:
-            return
-        self.current_test["measurement_settings"] = self._sync_array_from_table(
-            self.ms_table, MS_COLUMNS
-        )
+        for key, widget in self.field_edits.items():
+            if isinstance(widget, QLineEdit):
+                self.current_test[key] = widget.text()
+            else:
+                self.current_test[key] = widget.toPlainText()
+        text = self.keywords_edit.toPlainText()
+        self.current_test["keywords"] = [line.strip() for line in text.splitlines() if line.strip()]
 
-    def _sync_th_from_table(self):
-        if not self.current_test:
-            return
-        self.current_test["acceptance_thresholds"] = self._sync_array_from_table(
-            self.th_table, TH_COLUMNS
-        )
+    def _schedule_markdown(self, *_):
+        self._md_timer.start()
 
-    def _sync_ex_from_table(self):
+    def _rebuild_markdown(self):
         if not self.current_test:
             return
-        self.current_test["example_data"] = self._sync_array_from_table(
-            self.ex_table, EX_COLUMNS
-        )
-
-    # ----- Handlers for cell changes (tables -> dict, live) -----
-
-    def on_rh_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
-            return
-        self._sync_rh_from_table()
+        self._sync_fields_from_widgets()
+        self._set_markdown(build_markdown_from_test(self.current_test))
 
-    def on_tp_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
+    def _set_markdown(self, text: str):
+        """Push text into the preview, skipping the re-layout if nothing changed."""
+        if text == self._md_text:
             return
-        self._sync_tp_from_table()
+        self._md_text = text
+        self.markdown_view.setPlainText(text)
 
-    def on_eq_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
-            return
-        self._sync_eq_from_table()
-
-    def on_ms_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
-            return
-        self._sync_ms_from_table()
+    # ----- Populate tables from test dict -----
 
-    def on_th_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
-            return
-        self._sync_th_from_table()
+    def _populate_tables_from_test(self, test: dict):
+        """Point each table model at its array in test, which it then edits in place."""
+        for key, model in self.table_models.items():
+            rows = test.get(key)
+            if not isinstance(rows, list):
+                rows = test[key] = []
+            model.set_rows(rows)
+        self._dirty_arrays.clear()
 
-    def on_ex_cell_changed(self, row: int, col: int):
-        if self._suppress_updates or not self.current_test:
-            return
-        self._sync_ex_from_table()
 
 def enable_windows_dark_titlebar(window: QWidget):
     """Ask Windows 10/11 to use a dark title bar for this window."""
     if platform.system() != "Windows":
         return
 
+    # Only needed here, so other platforms never load the ctypes extension
+    import ctypes
+    from ctypes import wintypes
+
     try:
         hwnd = wintypes.HWND(int(window.winId()))
 
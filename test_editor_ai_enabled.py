@@ -1,16 +1,28 @@
 import sys
 import json
+import asyncio
+import threading
+import hashlib
+import shelve
 import re
 import os
 import platform
 import ctypes
 from ctypes import wintypes
+from functools import lru_cache
 from pathlib import Path
 
-from openai import OpenAI
+import httpx
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    InternalServerError,
+    RateLimitError,
+)
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QKeySequence, QPalette, QColor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QKeySequence, QPalette, QColor, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -35,6 +47,37 @@ from PyQt6.QtWidgets import (
     QLabel,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(buf: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_atomic(path: Path, buf: bytes):
+    """Write buf to path via a temp file + os.replace, so a failed write never truncates path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(buf)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
 def build_markdown_from_test(test: dict) -> str:
     """Render a Markdown-ish view of a test dict."""
@@ -95,7 +138,169 @@ EX_COLUMNS = ["type", "description", "data_value", "file_ref", "notes"]
 RH_COLUMNS = ["rev", "rev_date", "description", "rev_by"]
 
 
+# ----- AI backend -----
+
+# All AI requests run on one long-lived asyncio loop in a daemon thread, so
+# the GUI thread never blocks and the AsyncOpenAI client (whose connection
+# pool is bound to the loop it first runs on) is reused across requests.
+_ai_loop: asyncio.AbstractEventLoop | None = None
+_ai_client: AsyncOpenAI | None = None
+# Read once; the editor checks it before building any request
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+AI_MODEL = "gpt-4o-mini"
+AI_SYSTEM_PROMPT = "You write concise, technically accurate test plan text."
+# Single-field generation is deterministic so its answers can be cached
+AI_TEMPERATURE = 0.0
+
+# On-disk cache of single-field answers, shared across sessions
+_AI_CACHE_PATH = os.path.expanduser("~/.test_editor_ai_cache")
+
+# Prose fields "Generate All Missing Fields" fills (plus keywords)
+AI_BATCH_FIELDS = [
+    "test_name", "purpose", "scope", "setup", "procedure",
+    "measurement", "acceptancecriteria", "conclusion",
+]
+
+# Test keys sent as context when generating each field; fields not listed
+# get the whole test
+RELEVANT_FIELDS = {
+    "test_name": ["purpose", "scope"],
+    "purpose": ["test_name", "scope", "setup"],
+    "scope": ["test_name", "purpose"],
+    "setup": ["test_name", "purpose", "testpoints", "measurement_equipment"],
+    "procedure": [
+        "test_name", "purpose", "setup",
+        "testpoints", "measurement_equipment", "measurement_settings",
+    ],
+    "measurement": [
+        "test_name", "procedure",
+        "testpoints", "measurement_equipment", "measurement_settings",
+    ],
+    "acceptancecriteria": ["test_name", "measurement", "acceptance_thresholds"],
+    "conclusion": [
+        "test_name", "purpose", "acceptancecriteria",
+        "acceptance_thresholds", "example_data",
+    ],
+    "keywords": ["test_name", "purpose", "scope"],
+}
+
+# Keep a few TLS sessions to the API alive between Alt+A presses
+_AI_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=8, max_connections=16, keepalive_expiry=60.0
+)
+_AI_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def _get_ai_loop() -> asyncio.AbstractEventLoop:
+    global _ai_loop
+    if _ai_loop is None:
+        _ai_loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=_ai_loop.run_forever, name="ai-loop", daemon=True
+        ).start()
+    return _ai_loop
+
+
+def _get_ai_client() -> AsyncOpenAI:
+    """Create the shared client on first use (called on the AI loop)."""
+    global _ai_client
+    if _ai_client is None:
+        if not _OPENAI_API_KEY:
+            raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+        _ai_client = AsyncOpenAI(
+            api_key=_OPENAI_API_KEY,
+            # Retries are handled (and bounded) by _create_completion
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                limits=_AI_HTTP_LIMITS, timeout=_AI_HTTP_TIMEOUT
+            ),
+        )
+    return _ai_client
+
+
+# Transient failures worth retrying; other API errors are reported at once
+_AI_RETRYABLE = (APIConnectionError, RateLimitError, InternalServerError)
+_AI_MAX_ATTEMPTS = 3
+
+
+async def _create_completion(**kwargs):
+    """chat.completions.create with exponential backoff (1 s, 2 s) on
+    connection, rate-limit and 5xx errors. Runs on the AI loop."""
+    client = _get_ai_client()
+    for attempt in range(_AI_MAX_ATTEMPTS):
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except _AI_RETRYABLE:
+            if attempt == _AI_MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+
+def _describe_ai_error(e: Exception) -> str:
+    if isinstance(e, APIStatusError):
+        return f"OpenAI returned HTTP {e.status_code}:\n{e.message}"
+    if isinstance(e, APIConnectionError):
+        return f"Could not reach OpenAI:\n{e}"
+    return str(e)
+
+
+def _ai_cache_key(prompt: str) -> str:
+    raw = f"{AI_MODEL}\0{AI_SYSTEM_PROMPT}\0{prompt}\0{AI_TEMPERATURE}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _ai_cache_get(key: str) -> str | None:
+    # The cache is best-effort: any dbm error is treated as a miss
+    try:
+        with shelve.open(_AI_CACHE_PATH) as db:
+            return db.get(key)
+    except Exception:
+        return None
+
+
+def _ai_cache_put(key: str, text: str):
+    try:
+        with shelve.open(_AI_CACHE_PATH) as db:
+            db[key] = text
+    except Exception:
+        pass
+
+
+async def _prewarm_ai_connection():
+    """Open a pooled connection so the first Alt+A skips DNS/TCP/TLS setup."""
+    try:
+        client = _get_ai_client()
+        # Unauthenticated is fine: only the keep-alive connection matters
+        await client._client.get("https://api.openai.com/v1/models", timeout=5.0)
+    except Exception:
+        pass
+
+
+def _cancel_ai_future(future):
+    """Cancel a request submitted to the AI loop; always returns None.
+
+    Cancelling the future cancels the task on the loop, which aborts the
+    HTTP request. The coroutine sees CancelledError and emits nothing.
+    """
+    if future is not None and not future.done():
+        future.cancel()
+    return None
+
+
+def prewarm_ai_connection():
+    if not _OPENAI_API_KEY:
+        return
+    asyncio.run_coroutine_threadsafe(_prewarm_ai_connection(), _get_ai_loop())
+
+
 class TestEditorWindow(QMainWindow):
+    # (target context, text) delivered from the AI loop to the GUI thread
+    ai_stream_chunk = pyqtSignal(object, str)
+    ai_result_ready = pyqtSignal(object, str)
+    ai_failed = pyqtSignal(object, str)
+    ai_batch_ready = pyqtSignal(object, object)  # (batch context, {field: text})
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TestBASE Plan Editor (v0)")
@@ -105,10 +310,32 @@ class TestEditorWindow(QMainWindow):
         self.current_path: Path | None = None  # None = new/unsaved test
         self.current_test: dict = {}
         self._suppress_updates = False
+        # Per-target prompt JSON of current_test; cleared whenever it changes
+        self._prompt_json_cache: dict[str, str] = {}
 
         # Remember which field AI is targeting
         # (kind, key, widget)
         self.ai_target_context = None
+        # Disk-cache key of the request behind ai_target_context
+        self._ai_cache_pending: str | None = None
+        self.ai_stream_chunk.connect(self.on_ai_stream_chunk)
+        self.ai_result_ready.connect(self.on_ai_result_ready)
+        self.ai_failed.connect(self.on_ai_failed)
+        self.ai_batch_ready.connect(self.on_ai_batch_ready)
+        # ("batch", path) token of the in-flight multi-field request; cleared
+        # by _reset_ai_target when another test is opened
+        self._ai_batch_context = None
+        # Futures of the in-flight requests, cancelled when superseded
+        self._active_ai_future = None
+        self._active_ai_batch_future = None
+
+        # Replace/Append push the new value into current_test after the
+        # widget has repainted; rapid clicks coalesce into one update
+        self._pending_field_update = None  # (test, kind, key)
+        self._field_update_timer = QTimer(self)
+        self._field_update_timer.setSingleShot(True)
+        self._field_update_timer.setInterval(50)
+        self._field_update_timer.timeout.connect(self._flush_pending_field_update)
 
         self._create_actions()
         self._create_menu()
@@ -135,6 +362,9 @@ class TestEditorWindow(QMainWindow):
         self.ai_generate_act.setShortcut(QKeySequence("Alt+A"))
         self.ai_generate_act.triggered.connect(self.on_generate_ai_content)
 
+        self.ai_batch_act = QAction("Generate All Missing Fields", self)
+        self.ai_batch_act.triggered.connect(self.on_generate_ai_batch)
+
     def _create_menu(self):
         menubar = self.menuBar()
 
@@ -148,6 +378,7 @@ class TestEditorWindow(QMainWindow):
 
         tools_menu = menubar.addMenu("&Tools")
         tools_menu.addAction(self.ai_generate_act)
+        tools_menu.addAction(self.ai_batch_act)
 
     # ----- UI -----
 
@@ -209,6 +440,9 @@ class TestEditorWindow(QMainWindow):
         add_text_field("acceptancecriteria", "Acceptance Criteria")
         add_text_field("conclusion", "Conclusion")
 
+        # Reverse lookup for _get_active_field
+        self._widget_to_key = {id(w): k for k, w in self.field_edits.items()}
+
         tabs.addTab(form_widget, "Form")
 
         # Markdown preview tab
@@ -424,15 +658,16 @@ class TestEditorWindow(QMainWindow):
 
     def load_tests_from_folder(self, folder: Path):
         self.test_list.clear()
+        self._reset_ai_target()
         self.current_path = None
         self.current_test = {}
+        self._prompt_json_cache.clear()
         self._clear_current_test_view()
         self._suppress_updates = True
 
         for path in sorted(folder.glob("*.json")):
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _json_loads(path.read_bytes())
                 # Heuristic: treat as test if it has test_name and test_no
                 if "test_name" in data and "test_no" in data:
                     label = f"{data.get('test_no', '?')} – {data.get('test_name', 'Untitled')}"
@@ -464,14 +699,17 @@ class TestEditorWindow(QMainWindow):
 
     def load_test_file(self, path: Path):
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(path.read_bytes())
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load {path}:\n{e}")
             return
 
+        # Reloading the same file (e.g. after saving a new test) keeps the target
+        if path != self.current_path:
+            self._reset_ai_target()
         self.current_path = path
         self.current_test = data
+        self._prompt_json_cache.clear()
         self._suppress_updates = True
 
         # Populate core fields
@@ -546,8 +784,10 @@ class TestEditorWindow(QMainWindow):
 
         # If this was the current test, clear editor
         if self.current_path and path == self.current_path:
+            self._reset_ai_target()
             self.current_path = None
             self.current_test = {}
+            self._prompt_json_cache.clear()
             self._clear_current_test_view()
 
         # Select a neighbor, if any remain
@@ -564,15 +804,12 @@ class TestEditorWindow(QMainWindow):
         src_path = Path(path_str)
 
         try:
-            with src_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Freshly parsed, so it can be modified without a copy
+            new_test = _json_loads(src_path.read_bytes())
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to read source test:\n{src_path}\n\n{e}")
             return
 
-        # Deep copy
-        new_test = json.loads(json.dumps(data))
-
         old_no = (new_test.get("test_no") or "").strip()
         new_no = self._suggest_next_test_no()
         new_test["last_test_no"] = old_no
@@ -604,8 +841,7 @@ class TestEditorWindow(QMainWindow):
 
         # Write new file
         try:
-            with dst_path.open("w", encoding="utf-8") as f:
-                json.dump(new_test, f, indent=2, ensure_ascii=False)
+            _write_atomic(dst_path, _json_dumps(new_test))
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to write duplicated test:\n{dst_path}\n\n{e}")
             return
@@ -658,7 +894,9 @@ class TestEditorWindow(QMainWindow):
             "example_data": [],
         }
 
+        self._reset_ai_target()
         self.current_test = new_test
+        self._prompt_json_cache.clear()
         self.current_path = None  # unsaved
         self._suppress_updates = True
 
@@ -682,6 +920,8 @@ class TestEditorWindow(QMainWindow):
     # ----- Save -----
 
     def save_current_test(self):
+        # Apply a Replace/Append that is still waiting on the timer
+        self._flush_pending_field_update()
         if not self.current_test:
             QMessageBox.information(self, "Nothing to Save", "No test is currently loaded.")
             return
@@ -708,6 +948,7 @@ class TestEditorWindow(QMainWindow):
             if not test_no.isdigit():
                 test_no = self._suggest_next_test_no()
                 self.current_test["test_no"] = test_no
+                self._prompt_json_cache.clear()
             base_name = self._slugify_name(self.current_test.get("test_name", "new_test"))
             candidate = f"TB_{test_no}_{base_name}.json"
             path = self.current_folder / candidate
@@ -721,8 +962,7 @@ class TestEditorWindow(QMainWindow):
             self.current_path = path
 
         try:
-            with self.current_path.open("w", encoding="utf-8") as f:
-                json.dump(self.current_test, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.current_path, _json_dumps(self.current_test))
             self._add_or_update_list_item_for_current_test()
 
             # Optional: quiet status bar message instead of popup
@@ -737,6 +977,7 @@ class TestEditorWindow(QMainWindow):
         if self._suppress_updates or not self.current_test:
             return
         self.current_test[key] = value
+        self._prompt_json_cache.clear()
         # Live update of markdown
         self.markdown_view.setPlainText(build_markdown_from_test(self.current_test))
 
@@ -746,6 +987,7 @@ class TestEditorWindow(QMainWindow):
         text = self.keywords_edit.toPlainText()
         keywords = [line.strip() for line in text.splitlines() if line.strip()]
         self.current_test["keywords"] = keywords
+        self._prompt_json_cache.clear()
 
     # ----- Populate tables from test dict -----
 
@@ -772,6 +1014,8 @@ class TestEditorWindow(QMainWindow):
     # ----- Sync helpers: tables -> dict -----
 
     def _sync_array_from_table(self, table: QTableWidget, cols: list[str]) -> list[dict]:
+        # The caller stores the result in current_test
+        self._prompt_json_cache.clear()
         rows_data: list[dict] = []
         for row in range(table.rowCount()):
             row_dict: dict = {}
@@ -869,9 +1113,9 @@ class TestEditorWindow(QMainWindow):
             return None
 
         # Core form fields
-        for key, widget in self.field_edits.items():
-            if w is widget:
-                return ("core", key, widget)
+        key = self._widget_to_key.get(id(w))
+        if key is not None:
+            return ("core", key, self.field_edits[key])
 
         # Keywords editor
         if w is self.keywords_edit:
@@ -881,6 +1125,16 @@ class TestEditorWindow(QMainWindow):
 
         return None
 
+    def _check_ai_configured(self) -> bool:
+        if _OPENAI_API_KEY:
+            return True
+        QMessageBox.warning(
+            self,
+            "AI Not Configured",
+            "OPENAI_API_KEY environment variable is not set.",
+        )
+        return False
+
     def on_generate_ai_content(self):
         """Triggered by Alt + A or Tools → Generate AI Content."""
         if not self.current_test:
@@ -888,6 +1142,8 @@ class TestEditorWindow(QMainWindow):
                 self, "No Test Loaded", "Open or create a test first."
             )
             return
+        if not self._check_ai_configured():
+            return
 
         ctx = self._get_active_field()
         if not ctx:
@@ -898,6 +1154,9 @@ class TestEditorWindow(QMainWindow):
             )
             return
 
+        # Retargeting supersedes whatever Alt+A was still running
+        self._active_ai_future = _cancel_ai_future(self._active_ai_future)
+
         kind, key, widget = ctx
         self.ai_target_context = ctx
         self.ai_target_label.setText(f"Target: {key}")
@@ -910,49 +1169,220 @@ class TestEditorWindow(QMainWindow):
         else:
             current_val = ""
 
-        test_json = json.dumps(self.current_test, indent=2)
+        test_json = self._prompt_json(key)
 
         prompt = (
             "You are helping complete an engineering hardware test plan for a circuit.\n"
-            "I will give you the current JSON for a single test, and the field I want you to help with.\n"
+            "I will give you the relevant parts of the current JSON for a single test, and the field I want you to help with.\n"
             "Return ONLY suggested text for that single field. No markdown, no JSON, no extra explanation.\n\n"
             f"Field to write: {key}\n"
             f"Current value (may be empty): {current_val!r}\n\n"
             f"Test JSON:\n{test_json}\n"
         )
 
-        self.ai_content_edit.setPlainText("Generating AI content…")
+        cache_key = _ai_cache_key(prompt)
+        cached = _ai_cache_get(cache_key)
+        if cached is not None:
+            self._ai_cache_pending = None
+            self._set_ai_busy(False)
+            self.ai_content_edit.setPlainText(cached)
+            return
 
+        # Start from an empty panel; the status shows as placeholder text so
+        # it never ends up in the field
+        self.ai_content_edit.clear()
+        self._set_ai_busy(True)
+        self._ai_cache_pending = cache_key
+
+        # Run the request on the AI loop; the result comes back through
+        # ai_result_ready / ai_failed on the GUI thread.
+        self._active_ai_future = asyncio.run_coroutine_threadsafe(
+            self._ai_call_async(ctx, prompt), _get_ai_loop()
+        )
+
+    def _reset_ai_target(self):
+        """Drop the AI target and requests when another test is opened.
+
+        The form widgets are shared by every test, so a (kind, key, widget)
+        target would otherwise carry one test's suggestion into the next.
+        """
+        self._active_ai_future = _cancel_ai_future(self._active_ai_future)
+        self.ai_target_context = None
+        self._ai_cache_pending = None
+        self.ai_target_label.setText("Target: (none)")
+        self.ai_content_edit.clear()
+        self._set_ai_busy(False)
+
+        self._active_ai_batch_future = _cancel_ai_future(self._active_ai_batch_future)
+        if self._ai_batch_context is not None:
+            self._ai_batch_context = None
+            self.statusBar().clearMessage()
+
+    def _set_ai_busy(self, busy: bool):
+        """Lock Replace/Append while a suggestion is still arriving."""
+        self.ai_replace_btn.setEnabled(not busy)
+        self.ai_append_btn.setEnabled(not busy)
+        self.ai_content_edit.setPlaceholderText(
+            "Generating AI content…" if busy else "AI suggestions will appear here…"
+        )
+
+    def _prompt_json(self, key: str | None) -> str:
+        """Serialized context for `key` (None = the whole test), cached."""
+        test_json = self._prompt_json_cache.get(key)
+        if test_json is None:
+            # Only send the parts of the test that inform this field
+            fields = RELEVANT_FIELDS.get(key, self.current_test.keys())
+            sub = {k: self.current_test[k] for k in fields if k in self.current_test}
+            test_json = json.dumps(sub, indent=2)
+            self._prompt_json_cache[key] = test_json
+        return test_json
+
+    async def _ai_call_async(self, ctx, prompt: str):
+        """Stream the completion to the GUI thread as it arrives."""
+        parts: list[str] = []
         try:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise RuntimeError(
-                    "OPENAI_API_KEY environment variable is not set."
-                )
+            stream = await _create_completion(
+                model=AI_MODEL,
+                messages=[
+                    {"role": "system", "content": AI_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=AI_TEMPERATURE,
+                stream=True,
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    self.ai_stream_chunk.emit(ctx, delta)
+        except Exception as e:
+            self.ai_failed.emit(ctx, _describe_ai_error(e))
+            return
+        self.ai_result_ready.emit(ctx, "".join(parts).strip())
 
-            # New-style client (openai>=1.0)
-            client = OpenAI(api_key=api_key)
+    def on_ai_stream_chunk(self, ctx, delta: str):
+        # A newer Alt+A has retargeted the panel; drop the stale answer
+        if ctx is not self.ai_target_context:
+            return
+        # Insert at the end instead of re-setting the whole document per token
+        cursor = self.ai_content_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(delta)
 
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
+    def on_ai_result_ready(self, ctx, text: str):
+        if ctx is not self.ai_target_context:
+            return
+        self._set_ai_busy(False)
+        if text and self._ai_cache_pending:
+            _ai_cache_put(self._ai_cache_pending, text)
+        self._ai_cache_pending = None
+
+    def on_ai_failed(self, ctx, message: str):
+        if ctx is self._ai_batch_context:
+            self._ai_batch_context = None
+            self.statusBar().clearMessage()
+        elif ctx is self.ai_target_context:
+            self._ai_cache_pending = None
+            self.ai_content_edit.clear()
+            self._set_ai_busy(False)
+        else:
+            return
+        QMessageBox.warning(
+            self, "AI Error", f"Failed to generate AI content:\n{message}"
+        )
+
+    def on_generate_ai_batch(self):
+        """Tools → Generate All Missing Fields: one request for every empty field."""
+        if not self.current_test:
+            QMessageBox.information(
+                self, "No Test Loaded", "Open or create a test first."
+            )
+            return
+        if not self._check_ai_configured():
+            return
+
+        targets = [
+            key for key in AI_BATCH_FIELDS
+            if not self._widget_text(self.field_edits[key]).strip()
+        ]
+        if not self.keywords_edit.toPlainText().strip():
+            targets.append("keywords")
+        if not targets:
+            self.statusBar().showMessage("No empty fields to generate.", 3000)
+            return
+
+        prompt = (
+            "You are helping complete an engineering hardware test plan for a circuit.\n"
+            "I will give you the current JSON for a single test and a list of empty fields.\n"
+            "Return a JSON object with one key per listed field, each mapped to the suggested "
+            "plain text for that field (for keywords, a list of short strings). "
+            "No markdown and no extra keys.\n\n"
+            f"Fields to write: {', '.join(targets)}\n\n"
+            f"Test JSON:\n{self._prompt_json(None)}\n"
+        )
+
+        self._active_ai_batch_future = _cancel_ai_future(self._active_ai_batch_future)
+        ctx = ("batch", self.current_path)
+        self._ai_batch_context = ctx
+        self.statusBar().showMessage(f"Generating {len(targets)} fields…")
+        self._active_ai_batch_future = asyncio.run_coroutine_threadsafe(
+            self._ai_batch_async(ctx, prompt, targets), _get_ai_loop()
+        )
+
+    async def _ai_batch_async(self, ctx, prompt: str, targets: list[str]):
+        try:
+            response = await _create_completion(
+                model=AI_MODEL,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You write concise, technically accurate test plan text.",
-                    },
+                    {"role": "system", "content": AI_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.2,
+                response_format={"type": "json_object"},
             )
-
-            text = response.choices[0].message.content.strip()
-            self.ai_content_edit.setPlainText(text)
+            data = json.loads(response.choices[0].message.content)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object from the model.")
         except Exception as e:
-            self.ai_content_edit.setPlainText("")
-            QMessageBox.warning(
-                self, "AI Error", f"Failed to generate AI content:\n{e}"
-            )
+            self.ai_failed.emit(ctx, _describe_ai_error(e))
+            return
+        self.ai_batch_ready.emit(ctx, {k: data[k] for k in targets if k in data})
 
+    def on_ai_batch_ready(self, ctx, results: dict):
+        # Superseded by a newer batch, or the test was closed (the reset
+        # already cleared the context and status)
+        if ctx is not self._ai_batch_context:
+            return
+        self._ai_batch_context = None
+
+        filled = 0
+        for key, value in results.items():
+            if key == "keywords":
+                if not isinstance(value, list):
+                    value = str(value).splitlines()
+                text = "\n".join(str(v).strip() for v in value if str(v).strip())
+                widget = self.keywords_edit
+            else:
+                text = str(value).strip()
+                widget = self.field_edits[key]
+            # Only fill fields the user hasn't typed into meanwhile; the
+            # widgets' change signals update current_test
+            if not text or self._widget_text(widget).strip():
+                continue
+            if isinstance(widget, QLineEdit):
+                widget.setText(text)
+            else:
+                widget.setPlainText(text)
+            filled += 1
+        self.statusBar().showMessage(f"AI filled {filled} fields.", 3000)
+
+    @staticmethod
+    def _widget_text(widget) -> str:
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        return widget.toPlainText()
 
     def on_ai_replace_clicked(self):
         """Replace the selected field with the AI suggestion."""
@@ -970,18 +1400,16 @@ class TestEditorWindow(QMainWindow):
             return
 
         self._suppress_updates = True
-        if isinstance(widget, QLineEdit):
-            widget.setText(text)
-        elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
-            widget.setPlainText(text)
-        self._suppress_updates = False
+        try:
+            if isinstance(widget, QLineEdit):
+                widget.setText(text)
+            elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+                widget.setPlainText(text)
+        finally:
+            self._suppress_updates = False
 
         # Update backing dict
-        if kind == "core":
-            self.on_field_changed(key, text)
-        elif kind == "keywords":
-            self.keywords_edit.setPlainText(text)
-            self.on_keywords_changed()
+        self._queue_field_update(kind, key)
 
     def on_ai_append_clicked(self):
         """Append the AI suggestion to the selected field."""
@@ -999,37 +1427,53 @@ class TestEditorWindow(QMainWindow):
             return
 
         self._suppress_updates = True
-        if isinstance(widget, QLineEdit):
-            current = widget.text().strip()
-            if current:
-                widget.setText(current + " " + text)
-            else:
-                widget.setText(text)
-            new_val = widget.text()
-        elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
-            current = widget.toPlainText().rstrip()
-            if current:
-                widget.setPlainText(current + "\n\n" + text)
-            else:
-                widget.setPlainText(text)
-            new_val = widget.toPlainText()
-        else:
-            new_val = text
-        self._suppress_updates = False
-
+        try:
+            if isinstance(widget, QLineEdit):
+                current = widget.text().strip()
+                if current:
+                    widget.setText(current + " " + text)
+                else:
+                    widget.setText(text)
+            elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+                # Edit at the end of the document instead of re-setting all of it:
+                # select any trailing whitespace and replace it with the new text
+                doc = widget.document()
+                cursor = QTextCursor(doc)
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                pos = cursor.position()
+                while pos > 0 and doc.characterAt(pos - 1).isspace():
+                    pos -= 1
+                cursor.setPosition(pos, QTextCursor.MoveMode.KeepAnchor)
+                cursor.insertText(("\n\n" + text) if pos > 0 else text)
+        finally:
+            self._suppress_updates = False
+
+        self._queue_field_update(kind, key)
+
+    def _queue_field_update(self, kind: str, key: str):
+        self._pending_field_update = (self.current_test, kind, key)
+        self._field_update_timer.start()
+
+    def _flush_pending_field_update(self):
+        if self._pending_field_update is None:
+            return
+        test, kind, key = self._pending_field_update
+        self._pending_field_update = None
+        # Another test was opened in the meantime
+        if test is not self.current_test:
+            return
+        # Re-read the widget: the user may have kept typing after the click
         if kind == "core":
-            self.on_field_changed(key, new_val)
+            self.on_field_changed(key, self._widget_text(self.field_edits[key]))
         elif kind == "keywords":
-            self.keywords_edit.setPlainText(new_val)
             self.on_keywords_changed()
 
 
 # ----- Dark mode helpers -----
 
-def apply_dark_palette(app: QApplication):
-    """Apply a dark theme to the whole application."""
-    app.setStyle(QStyleFactory.create("Fusion"))
-
+@lru_cache(maxsize=1)
+def _build_dark_palette() -> QPalette:
+    """Build the dark palette once (needs a QApplication to exist)."""
     palette = QPalette()
     # Try to align with Windows dark title bar
     bg = QColor(32, 32, 32)   # Window background
@@ -1049,38 +1493,42 @@ def apply_dark_palette(app: QApplication):
     palette.setColor(QPalette.ColorRole.Highlight, QColor(90, 160, 255))
     palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
 
-    app.setPalette(palette)
+    return palette
+
+
+def apply_dark_palette(app: QApplication):
+    """Apply a dark theme to the whole application."""
+    app.setStyle(QStyleFactory.create("Fusion"))
+    app.setPalette(_build_dark_palette())
+
+
+# Resolve DwmSetWindowAttribute and its prototype once (Windows only)
+_DwmSetWindowAttribute = None
+if platform.system() == "Windows":
+    try:
+        _DwmSetWindowAttribute = ctypes.windll.dwmapi.DwmSetWindowAttribute
+        _DwmSetWindowAttribute.argtypes = [
+            wintypes.HWND, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint
+        ]
+        _DwmSetWindowAttribute.restype = ctypes.c_long
+    except (AttributeError, OSError):
+        _DwmSetWindowAttribute = None
 
 
 def enable_windows_dark_titlebar(window: QWidget):
     """Ask Windows 10/11 to use a dark title bar for this window."""
-    if platform.system() != "Windows":
+    if _DwmSetWindowAttribute is None:
         return
 
     try:
         hwnd = wintypes.HWND(int(window.winId()))
-
-        # Windows 10 1809+ / 11: DWMWA_USE_IMMERSIVE_DARK_MODE
-        DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-
         value = ctypes.c_int(1)
-        dwmapi = ctypes.windll.dwmapi
-
-        # Try attribute 20, fall back to 19 if needed
-        res = dwmapi.DwmSetWindowAttribute(
-            hwnd,
-            ctypes.c_int(DWMWA_USE_IMMERSIVE_DARK_MODE),
-            ctypes.byref(value),
-            ctypes.sizeof(value),
-        )
+
+        # Windows 10 1809+ / 11: DWMWA_USE_IMMERSIVE_DARK_MODE is 20;
+        # fall back to 19 on older builds
+        res = _DwmSetWindowAttribute(hwnd, 20, ctypes.byref(value), ctypes.sizeof(value))
         if res != 0:
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 19
-            dwmapi.DwmSetWindowAttribute(
-                hwnd,
-                ctypes.c_int(DWMWA_USE_IMMERSIVE_DARK_MODE),
-                ctypes.byref(value),
-                ctypes.sizeof(value),
-            )
+            _DwmSetWindowAttribute(hwnd, 19, ctypes.byref(value), ctypes.sizeof(value))
     except Exception:
         # If anything fails, just ignore and keep running
         pass
@@ -1089,6 +1537,7 @@ def enable_windows_dark_titlebar(window: QWidget):
 def main():
     app = QApplication(sys.argv)
     apply_dark_palette(app)
+    prewarm_ai_connection()
 
     win = TestEditorWindow()
     win.show()